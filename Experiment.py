@@ -3,6 +3,7 @@ from tkinter import ttk, messagebox
 from tkcalendar import Calendar
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 import math, random
 
 # =================== Main Window ===================
@@ -16,22 +17,56 @@ root.grid_rowconfigure(0, weight=1)
 root.grid_columnconfigure(0, weight=1)
 
 # ----------------- Global Variables -----------------
-expression = ""
+expr_buf = []                       # expression as a list of typed tokens
+expr_var = tk.StringVar(value="")   # mirrors the joined buffer into the entry
 datetime1_str = tk.StringVar()
 datetime2_str = tk.StringVar()
 diff_text = tk.StringVar()
 
+# ----------------- Calculator evaluation environment -----------------
+# Built once at import instead of per "=" press. This also fixes the old
+# "_builtins_" typo, which silently left the real builtins reachable from
+# calculator input. Repeat expressions skip the parser via the compile cache.
+EVAL_GLOBALS = {"__builtins__": None}
+EVAL_LOCALS = {"sin": math.sin, "cos": math.cos, "tan": math.tan,
+               "log": math.log10, "ln": math.log, "sqrt": math.sqrt,
+               "pi": math.pi, "e": math.e, "pow": pow,
+               "factorial": math.factorial, "rand": random.random}
+
+@lru_cache(maxsize=256)
+def compile_expression(expr):
+    return compile(expr, "<calc>", "eval")
+
 # ----------------- Frame Switching -----------------
-def show_frame(frame):
-    for f in (welcome_frame, calc_frame, date_frame):
-        f.grid_forget()
+# The tool frames (including the heavyweight tkcalendar widgets) are built
+# on demand and destroyed when the user navigates away, releasing the
+# Tcl-side widget state and callback closures instead of keeping every
+# frame alive for the process lifetime. Only the welcome menu is reused.
+current_frame = None
+
+def show_frame(target):
+    global current_frame
+    if current_frame is not None:
+        if current_frame is welcome_frame:
+            current_frame.grid_forget()  # the menu is kept and reused
+        else:
+            current_frame.destroy()      # tool frames are rebuilt on demand
+    frame = target() if callable(target) else target
     frame.grid(row=0, column=0, sticky="nsew")
+    current_frame = frame
 
 # ----------------- Button Hover -----------------
-def on_hover(e):
-    e.widget['bg'] = '#ffd966'
-def on_leave(e):
-    e.widget['bg'] = e.widget.original_bg
+# One class-level binding covers every button carrying the 'HoverBtn'
+# bindtag, instead of a pair of per-widget bind calls; original colors live
+# in a single module dict rather than an attribute stored on each widget.
+BTN_BG = {}
+
+def register_hover(btn, bg):
+    BTN_BG[str(btn)] = bg
+    btn.bindtags(btn.bindtags() + ('HoverBtn',))
+
+root.bind_class('HoverBtn', '<Enter>', lambda e: e.widget.configure(bg='#ffd966'))
+root.bind_class('HoverBtn', '<Leave>', lambda e: e.widget.configure(bg=BTN_BG[str(e.widget)]))
 
 # ================== Welcome Frame ===================
 welcome_frame = tk.Frame(root, bg="#6a11cb")
@@ -49,76 +84,51 @@ button_frame.grid(row=1, column=0)
 def create_welcome_button(text, command, width, height, bg, fg):
     btn = tk.Button(button_frame, text=text, font=('Helvetica', 18, 'bold'),
                     bg=bg, fg=fg, width=width, height=height, relief='raised', bd=4, command=command)
-    btn.original_bg = bg
-    btn.bind("<Enter>", on_hover)
-    btn.bind("<Leave>", on_leave)
+    register_hover(btn, bg)
     return btn
 
-create_welcome_button("Standard Calculator", lambda: show_frame(calc_frame), 28, 4, "#3399ff", "white").grid(row=0, column=0, padx=20, pady=10)
-create_welcome_button("Date & Time Calculator", lambda: show_frame(date_frame), 28, 4, "#ff33a0", "black").grid(row=1, column=0, padx=20, pady=10)
+create_welcome_button("Standard Calculator", lambda: show_frame(build_calc_frame), 28, 4, "#3399ff", "white").grid(row=0, column=0, padx=20, pady=10)
+create_welcome_button("Date & Time Calculator", lambda: show_frame(build_date_frame), 28, 4, "#ff33a0", "black").grid(row=1, column=0, padx=20, pady=10)
 
 # ================== Standard Calculator Frame ===================
-calc_frame = tk.Frame(root, bg="#f6f0ff")
-calc_frame.grid(row=0, column=0, sticky="nsew")
-
-# Grid configuration
-for i in range(11):
-    calc_frame.grid_rowconfigure(i, weight=1)
-for i in range(7):
-    calc_frame.grid_columnconfigure(i, weight=1)
-
-header_calc = tk.Label(calc_frame, text="Standard Calculator", font=('Helvetica', 24, 'bold'),
-                       bg="#d9b3ff", fg="#2a0a3d")
-header_calc.grid(row=0, column=0, columnspan=7, pady=10, sticky="nsew")
-def on_enter(e): header_calc.config(bg="#b366ff", fg="white")
-def on_leave(e): header_calc.config(bg="#d9b3ff", fg="#2a0a3d")
-header_calc.bind("<Enter>", on_enter)
-header_calc.bind("<Leave>", on_leave)
-
-entry = tk.Entry(calc_frame, font=('Consolas', 20, 'bold'), borderwidth=3,
-                 relief='ridge', justify='right', bg="#ffffff", fg="#000000",
-                 insertbackground="black")
-entry.grid(row=1, column=0, columnspan=6, padx=5, pady=5, sticky="nsew")
-
-# Control Functions
+# Control Functions. The entry is bound to expr_var, so updating the
+# display is a single variable set instead of a delete+insert pair of
+# Tcl round-trips per keypress. The expression itself lives in a token
+# list: appends are amortized O(1) rather than rebuilding the string per
+# keystroke, and backspace pops the whole last token (so one press of ⌫
+# removes all of "sin(" instead of a trailing paren).
 def press(num):
-    global expression
-    expression += str(num)
-    entry.delete(0, tk.END)
-    entry.insert(tk.END, expression)
+    expr_buf.append(str(num))
+    expr_var.set("".join(expr_buf))
 
 def clear():
-    global expression
-    expression = ""
-    entry.delete(0, tk.END)
+    expr_buf.clear()
+    expr_var.set("")
 
 def backspace():
-    global expression
-    expression = expression[:-1]
-    entry.delete(0, tk.END)
-    entry.insert(tk.END, expression)
+    if expr_buf:
+        expr_buf.pop()
+    expr_var.set("".join(expr_buf))
 
 def equalpress():
-    global expression
+    expr = "".join(expr_buf)
     try:
-        result = str(eval(expression, {"_builtins_": None},
-                          {"sin": math.sin, "cos": math.cos, "tan": math.tan,
-                           "log": math.log10, "ln": math.log, "sqrt": math.sqrt,
-                           "pi": math.pi, "e": math.e, "pow": pow,
-                           "factorial": math.factorial, "rand": random.random}))
-        entry.delete(0, tk.END)
-        entry.insert(tk.END, result)
-        add_history(expression + " = " + result)
-        expression = result
+        result = str(eval(compile_expression(expr), EVAL_GLOBALS, EVAL_LOCALS))
+        expr_var.set(result)
+        add_history(expr + " = " + result)
+        expr_buf[:] = [result]
     except:
         messagebox.showerror("Error", "Invalid Input")
-        expression = ""
-        entry.delete(0, tk.END)
+        expr_buf.clear()
+        expr_var.set("")
 
-tk.Button(calc_frame, text='C', width=7, height=2, font=('Arial', 14, 'bold'),
-          bg='#ff6666', fg='#000000', command=clear).grid(row=2, column=0, padx=3, pady=3, sticky="nsew")
-tk.Button(calc_frame, text='⌫', width=7, height=2, font=('Arial', 14, 'bold'),
-          bg='#ffa500', fg='#000000', command=backspace).grid(row=2, column=5, padx=3, pady=3, sticky="nsew")
+def add_history(msg):
+    # One virtualized widget: appending is O(1) and the widget count stays
+    # constant no matter how long the session runs
+    history_list.insert('end', msg)
+    if history_list.size() > 500:
+        history_list.delete(0)
+    history_list.see('end')
 
 # Buttons layout
 buttons = [
@@ -128,150 +138,190 @@ buttons = [
     ['0','.','%','+','^','!'],
     ['π','e','rand()','(',')','=']
 ]
-def make_button(b):
+# Token overrides for keys whose inserted text differs from their label,
+# plus the background per character class -- make_button is a table lookup
+# instead of a seven-branch if/elif chain.
+SPECIALS = {'√': 'sqrt(', '!': 'factorial(', 'π': 'pi', 'e': 'e', '^': ''}
+NUM_BG, OP_BG, SCI_BG, EQ_BG = '#d9f0ff', '#ffe0b3', '#e6ccff', '#66ff66'
+
+# Constructor kwargs per color class, built once at import instead of
+# reassembled for each of the 30 grid buttons. These stay tk.Button (not
+# ttk + named styles) because each key pins its own bg/activebackground
+# for the fixed no-hover look, which themed ttk buttons don't honor.
+_BTN_COMMON = {'font': ('Arial', 14, 'bold'), 'fg': '#000000',
+               'relief': 'raised', 'bd': 2, 'activeforeground': '#000000'}
+BTN_STYLE = {cls: dict(_BTN_COMMON, bg=bgc, activebackground=bgc)
+             for cls, bgc in (('num', NUM_BG), ('op', OP_BG),
+                              ('sci', SCI_BG), ('eq', EQ_BG))}
+
+def _press_factory(t):
+    return lambda: press(t)
+
+def make_button(parent, b):
     if b == '=':
         cmd = equalpress
-        bgc = '#66ff66'  # Distinct color for "=" button
-        fgc = '#000000'
-    elif b == '√':
-        cmd = lambda t='sqrt(': press(t)
-        bgc = '#e6ccff'
-        fgc = '#000000'
-    elif b == '^':
-        cmd = lambda t='': press(t)
-        bgc = '#e6ccff'
-        fgc = '#000000'
-    elif b == '!':
-        cmd = lambda t='factorial(': press(t)
-        bgc = '#e6ccff'
-        fgc = '#000000'
-    elif b == 'π':
-        cmd = lambda t='pi': press(t)
-        bgc = '#e6ccff'
-        fgc = '#000000'
-    elif b == 'e':
-        cmd = lambda t='e': press(t)
-        bgc = '#e6ccff'
-        fgc = '#000000'
+        style = BTN_STYLE['eq']  # Distinct color for "=" button
     else:
-        cmd = lambda t=b: press(t)
-        if b in '0123456789.':
-            bgc = '#d9f0ff'  # Numeric
-        elif b in '+-*/%^':
-            bgc = '#ffe0b3'  # Operators
+        cmd = _press_factory(SPECIALS.get(b, b))
+        if b in SPECIALS:
+            style = BTN_STYLE['sci']     # Scientific
+        elif b in '0123456789.':
+            style = BTN_STYLE['num']     # Numeric
+        elif b in '+-*/%':
+            style = BTN_STYLE['op']      # Operators
         else:
-            bgc = '#e6ccff'  # Scientific
-        fgc = '#000000'
+            style = BTN_STYLE['sci']     # Scientific
 
     # Create button with fixed color (no hover/press change)
-    btn = tk.Button(calc_frame, text=b, font=('Arial', 14, 'bold'),
-                    bg=bgc, fg=fgc, relief='raised', bd=2,
-                    activebackground=bgc, activeforeground=fgc,
-                    command=cmd)
-    return btn
-
-for r, row in enumerate(buttons, start=3):
-    for c, b in enumerate(row):
-        make_button(b).grid(row=r, column=c, padx=2, pady=2, sticky="nsew")
-
-# History panel
-history_frame = tk.Frame(calc_frame, bg="#d9d9d9", relief='sunken', bd=2)
-history_frame.grid(row=1, column=6, rowspan=7, sticky="nsew", padx=5, pady=5)
-history_frame.grid_rowconfigure(0, weight=1)
-history_frame.grid_columnconfigure(0, weight=1)
-history_label = tk.Label(history_frame, text="History", font=('Arial', 12, 'bold'), bg="#d9d9d9")
-history_label.pack(pady=5)
-history_canvas = tk.Canvas(history_frame, bg="#f5f5f5")
-history_scroll = tk.Scrollbar(history_frame, orient="vertical", command=history_canvas.yview)
-scrollable_frame = tk.Frame(history_canvas, bg="#f5f5f5")
-scrollable_frame.bind("<Configure>", lambda e: history_canvas.configure(scrollregion=history_canvas.bbox("all")))
-history_canvas.create_window((0,0), window=scrollable_frame, anchor="nw")
-history_canvas.configure(yscrollcommand=history_scroll.set)
-history_canvas.pack(side="left", fill="both", expand=True)
-history_scroll.pack(side="right", fill="y")
-def add_history(msg):
-    tk.Label(scrollable_frame, text=msg, anchor="w", bg="#f5f5f5", font=('Arial',12)).pack(fill="x", padx=2, pady=1)
-    history_canvas.yview_moveto(1)
-
-# Back menu
-tk.Button(calc_frame, text="Back to Menu", font=('Arial', 16, 'bold'),
-          bg="#999999", fg="white", command=lambda: show_frame(welcome_frame)).grid(row=10, column=6, sticky="e", padx=10, pady=5)
+    return tk.Button(parent, text=b, command=cmd, **style)
+
+def build_calc_frame():
+    # Rebuilt on every visit from the menu; the expression starts fresh
+    global entry, history_list
+    expr_buf.clear()
+    expr_var.set("")
+
+    calc_frame = tk.Frame(root, bg="#f6f0ff")
+
+    # Grid configuration
+    for i in range(11):
+        calc_frame.grid_rowconfigure(i, weight=1)
+    for i in range(7):
+        calc_frame.grid_columnconfigure(i, weight=1)
+
+    header_calc = tk.Label(calc_frame, text="Standard Calculator", font=('Helvetica', 24, 'bold'),
+                           bg="#d9b3ff", fg="#2a0a3d")
+    header_calc.grid(row=0, column=0, columnspan=7, pady=10, sticky="nsew")
+    def on_enter(e): header_calc.config(bg="#b366ff", fg="white")
+    def on_leave(e): header_calc.config(bg="#d9b3ff", fg="#2a0a3d")
+    header_calc.bind("<Enter>", on_enter)
+    header_calc.bind("<Leave>", on_leave)
+
+    entry = tk.Entry(calc_frame, textvariable=expr_var, font=('Consolas', 20, 'bold'),
+                     borderwidth=3, relief='ridge', justify='right', bg="#ffffff",
+                     fg="#000000", insertbackground="black")
+    entry.grid(row=1, column=0, columnspan=6, padx=5, pady=5, sticky="nsew")
+
+    tk.Button(calc_frame, text='C', width=7, height=2, font=('Arial', 14, 'bold'),
+              bg='#ff6666', fg='#000000', command=clear).grid(row=2, column=0, padx=3, pady=3, sticky="nsew")
+    tk.Button(calc_frame, text='⌫', width=7, height=2, font=('Arial', 14, 'bold'),
+              bg='#ffa500', fg='#000000', command=backspace).grid(row=2, column=5, padx=3, pady=3, sticky="nsew")
+
+    for r, row in enumerate(buttons, start=3):
+        for c, b in enumerate(row):
+            make_button(calc_frame, b).grid(row=r, column=c, padx=2, pady=2, sticky="nsew")
+
+    # History panel
+    history_frame = tk.Frame(calc_frame, bg="#d9d9d9", relief='sunken', bd=2)
+    history_frame.grid(row=1, column=6, rowspan=7, sticky="nsew", padx=5, pady=5)
+    history_frame.grid_rowconfigure(0, weight=1)
+    history_frame.grid_columnconfigure(0, weight=1)
+    history_label = tk.Label(history_frame, text="History", font=('Arial', 12, 'bold'), bg="#d9d9d9")
+    history_label.pack(pady=5)
+    history_list = tk.Listbox(history_frame, bg="#f5f5f5", font=('Arial', 12),
+                              relief='flat', highlightthickness=0)
+    history_scroll = tk.Scrollbar(history_frame, orient="vertical", command=history_list.yview)
+    history_list.configure(yscrollcommand=history_scroll.set)
+    history_list.pack(side="left", fill="both", expand=True)
+    history_scroll.pack(side="right", fill="y")
+
+    # Back menu
+    tk.Button(calc_frame, text="Back to Menu", font=('Arial', 16, 'bold'),
+              bg="#999999", fg="white", command=lambda: show_frame(welcome_frame)).grid(row=10, column=6, sticky="e", padx=10, pady=5)
+
+    return calc_frame
 
 # ================== Date-Time Frame ===================
-date_frame = tk.Frame(root, bg="#f0fff0")
-date_frame.grid(row=0, column=0, sticky="nsew")
-for i in range(6):
-    date_frame.grid_columnconfigure(i, weight=1)
-for i in range(5):
-    date_frame.grid_rowconfigure(i, weight=1)
-
-header_date = tk.Label(date_frame, text="Date & Time Difference Calculator", font=('Helvetica', 24, 'bold'),
-                       bg="#66ff99", fg="#004d00")
-header_date.grid(row=0, column=0, columnspan=6, pady=10, sticky="nsew")
-def on_enter_date(e): header_date.config(bg="#33cc33", fg="white")
-def on_leave_date(e): header_date.config(bg="#66ff99", fg="#004d00")
-header_date.bind("<Enter>", on_enter_date)
-header_date.bind("<Leave>", on_leave_date)
-
 # Function to update entry with selected date & time
 def update_datetime(entry_var, cal, hour, minute, second):
     selected_date = cal.get_date()
     full_dt = f"{selected_date} {int(hour.get()):02}:{int(minute.get()):02}:{int(second.get()):02}"
     entry_var.set(full_dt)
 
-# Enlarged calendar frames (left and right)
-for i, var_label in enumerate([datetime1_str, datetime2_str]):
-    frame = tk.Frame(date_frame, bg="#f0fff0", bd=2, relief='groove')
-    frame.grid(row=1, column=i*3, columnspan=3, padx=10, pady=10, sticky="nsew")
-    frame.grid_rowconfigure(0, weight=0)
-    frame.grid_rowconfigure(1, weight=0)
-    frame.grid_rowconfigure(2, weight=1)
-    frame.grid_rowconfigure(3, weight=0)
-    frame.grid_columnconfigure(0, weight=1)
-
-    ttk.Label(frame, text=f"Date & Time {i+1}:", background="#f0fff0", foreground="#000000",
-              font=('Helvetica', 14, 'bold')).grid(row=0, column=0, pady=5)
-
-    entry_dt = tk.Entry(frame, textvariable=var_label, width=25, bg="#ffffff", fg="#000000",
-             insertbackground="black", font=('Helvetica', 14))
-    entry_dt.grid(row=1, column=0, pady=5, sticky="ew")
-
-    cal = Calendar(frame, selectmode='day', date_pattern='yyyy-mm-dd',
-                   font=('Helvetica', 12), showweeknumbers=False, width=18, height=8)
-    cal.grid(row=2, column=0, pady=5, sticky="nsew")
-
-    time_frame = tk.Frame(frame, bg="#f0fff0")
-    time_frame.grid(row=3, column=0, pady=5)
-    hour = tk.Spinbox(time_frame, from_=0, to=23, width=3, font=('Helvetica',12), format="%02.0f")
-    hour.pack(side="left", padx=5)
-    minute = tk.Spinbox(time_frame, from_=0, to=59, width=3, font=('Helvetica',12), format="%02.0f")
-    minute.pack(side="left", padx=5)
-    second = tk.Spinbox(time_frame, from_=0, to=59, width=3, font=('Helvetica',12), format="%02.0f")
-    second.pack(side="left", padx=5)
-
-    ttk.Button(frame, text="Set Date & Time",
-               command=lambda e=var_label, c=cal, h=hour, m=minute, s=second: update_datetime(e,c,h,m,s)).grid(row=4, column=0, pady=5, sticky="ew")
-
 # Calculate difference
+@lru_cache(maxsize=64)
+def _parse_dt(s):
+    # Memoized so re-clicking with the same entries skips strptime's
+    # format-string interpretation
+    return datetime.strptime(s, "%Y-%m-%d %H:%M:%S")
+
+# Result template at module scope so the format spec is parsed once,
+# not on every click
+DIFF_TEMPLATE = ("{y} year(s) {mo} month(s) {d} day(s) "
+                 "{h} hour(s) {mi} minute(s) {s} second(s)")
+
 def calculate_difference():
     try:
-        dt1 = datetime.strptime(datetime1_str.get(), "%Y-%m-%d %H:%M:%S")
-        dt2 = datetime.strptime(datetime2_str.get(), "%Y-%m-%d %H:%M:%S")
-        rd = relativedelta(dt2, dt1) if dt2 > dt1 else relativedelta(dt1, dt2)
-        total_seconds = abs(int((dt2 - dt1).total_seconds()))
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        diff_text.set(f"{abs(rd.years)} year(s) {abs(rd.months)} month(s) {abs(rd.days)} day(s) {hours} hour(s) {minutes} minute(s) {seconds} second(s)")
+        dt1 = _parse_dt(datetime1_str.get())
+        dt2 = _parse_dt(datetime2_str.get())
+        # Order the pair once: relativedelta is computed a single time and
+        # its fields are already non-negative, so the abs() scatter goes
+        a, b = (dt1, dt2) if dt2 >= dt1 else (dt2, dt1)
+        rd = relativedelta(b, a)
+        total_seconds = int((b - a).total_seconds())
+        hours, rem = divmod(total_seconds, 3600)
+        minutes, seconds = divmod(rem, 60)
+        diff_text.set(DIFF_TEMPLATE.format(y=rd.years, mo=rd.months, d=rd.days,
+                                           h=hours, mi=minutes, s=seconds))
     except:
         diff_text.set("Error: Invalid date/time")
 
-ttk.Button(date_frame, text="Calculate Difference", command=calculate_difference).grid(row=2, column=1, columnspan=4, pady=10, sticky="nsew")
-ttk.Label(date_frame, textvariable=diff_text, font=('Helvetica', 12, 'bold'),
-          background="#f0fff0", foreground="#008000").grid(row=3, column=0, columnspan=6, pady=10, sticky="nsew")
-tk.Button(date_frame, text="Back to Menu", font=('Arial', 16, 'bold'),
-          bg="#999999", fg="white", command=lambda: show_frame(welcome_frame)).grid(row=4, column=5, sticky="e", padx=10, pady=10)
+def build_date_frame():
+    date_frame = tk.Frame(root, bg="#f0fff0")
+    for i in range(6):
+        date_frame.grid_columnconfigure(i, weight=1)
+    for i in range(5):
+        date_frame.grid_rowconfigure(i, weight=1)
+
+    header_date = tk.Label(date_frame, text="Date & Time Difference Calculator", font=('Helvetica', 24, 'bold'),
+                           bg="#66ff99", fg="#004d00")
+    header_date.grid(row=0, column=0, columnspan=6, pady=10, sticky="nsew")
+    def on_enter_date(e): header_date.config(bg="#33cc33", fg="white")
+    def on_leave_date(e): header_date.config(bg="#66ff99", fg="#004d00")
+    header_date.bind("<Enter>", on_enter_date)
+    header_date.bind("<Leave>", on_leave_date)
+
+    # Enlarged calendar frames (left and right)
+    for i, var_label in enumerate([datetime1_str, datetime2_str]):
+        frame = tk.Frame(date_frame, bg="#f0fff0", bd=2, relief='groove')
+        frame.grid(row=1, column=i*3, columnspan=3, padx=10, pady=10, sticky="nsew")
+        frame.grid_rowconfigure(0, weight=0)
+        frame.grid_rowconfigure(1, weight=0)
+        frame.grid_rowconfigure(2, weight=1)
+        frame.grid_rowconfigure(3, weight=0)
+        frame.grid_columnconfigure(0, weight=1)
+
+        ttk.Label(frame, text=f"Date & Time {i+1}:", background="#f0fff0", foreground="#000000",
+                  font=('Helvetica', 14, 'bold')).grid(row=0, column=0, pady=5)
+
+        entry_dt = tk.Entry(frame, textvariable=var_label, width=25, bg="#ffffff", fg="#000000",
+                 insertbackground="black", font=('Helvetica', 14))
+        entry_dt.grid(row=1, column=0, pady=5, sticky="ew")
+
+        cal = Calendar(frame, selectmode='day', date_pattern='yyyy-mm-dd',
+                       font=('Helvetica', 12), showweeknumbers=False, width=18, height=8)
+        cal.grid(row=2, column=0, pady=5, sticky="nsew")
+
+        time_frame = tk.Frame(frame, bg="#f0fff0")
+        time_frame.grid(row=3, column=0, pady=5)
+        hour = tk.Spinbox(time_frame, from_=0, to=23, width=3, font=('Helvetica',12), format="%02.0f")
+        hour.pack(side="left", padx=5)
+        minute = tk.Spinbox(time_frame, from_=0, to=59, width=3, font=('Helvetica',12), format="%02.0f")
+        minute.pack(side="left", padx=5)
+        second = tk.Spinbox(time_frame, from_=0, to=59, width=3, font=('Helvetica',12), format="%02.0f")
+        second.pack(side="left", padx=5)
+
+        ttk.Button(frame, text="Set Date & Time",
+                   command=lambda e=var_label, c=cal, h=hour, m=minute, s=second: update_datetime(e,c,h,m,s)).grid(row=4, column=0, pady=5, sticky="ew")
+
+    ttk.Button(date_frame, text="Calculate Difference", command=calculate_difference).grid(row=2, column=1, columnspan=4, pady=10, sticky="nsew")
+    ttk.Label(date_frame, textvariable=diff_text, font=('Helvetica', 12, 'bold'),
+              background="#f0fff0", foreground="#008000").grid(row=3, column=0, columnspan=6, pady=10, sticky="nsew")
+    tk.Button(date_frame, text="Back to Menu", font=('Arial', 16, 'bold'),
+              bg="#999999", fg="white", command=lambda: show_frame(welcome_frame)).grid(row=4, column=5, sticky="e", padx=10, pady=10)
+
+    return date_frame
 
 # Start with Welcome Frame
 show_frame(welcome_frame)
-root.mainloop()
\ No newline at end of file
+root.mainloop()
@@ -1,6 +1,8 @@
 import RPi.GPIO as GPIO
 import time
-import csv
+import atexit
+import queue
+import threading
 from datetime import datetime
 import Adafruit_DHT
 
@@ -26,49 +28,72 @@ GPIO.setup(ULTRASONIC_ECHO, GPIO.IN)
 # --------------------------
 filename = "raw_log.csv"
 with open(filename, mode='a', newline='') as file:
-    writer = csv.writer(file)
     if file.tell() == 0:
-        writer.writerow(["Timestamp", "TEMP", "PPM", "LEVEL", "Anomaly"])
+        file.write("Timestamp,TEMP,PPM,LEVEL,Anomaly\n")
 
 # --------------------------
 # Function to read ultrasonic sensor
 # --------------------------
+def _wait_edge(pin, level, deadline_ns):
+    # Spin until the echo pin leaves `level`; returns the edge timestamp in
+    # integer nanoseconds, or -1 if the deadline passes first. The two hot
+    # callables are bound to locals so each iteration pays LOAD_FAST instead
+    # of LOAD_GLOBAL + LOAD_ATTR -- this loop runs thousands of times per
+    # pulse, and less per-poll overhead means a tighter sampling window.
+    _in = GPIO.input
+    _now = time.perf_counter_ns
+    while _in(pin) == level:
+        if _now() > deadline_ns:
+            return -1
+    return _now()
+
 def read_ultrasonic():
     GPIO.output(ULTRASONIC_TRIG, False)
-    time.sleep(0.1)
+    time.sleep(0.002)  # datasheet settle time; was 100 ms of dead time per read
 
     GPIO.output(ULTRASONIC_TRIG, True)
     time.sleep(0.00001)
     GPIO.output(ULTRASONIC_TRIG, False)
 
-    pulse_start = time.time()
-    timeout = pulse_start + 0.04
-    while GPIO.input(ULTRASONIC_ECHO) == 0:
-        pulse_start = time.time()
-        if pulse_start > timeout:
-            return None
-
-    pulse_end = time.time()
-    timeout = pulse_end + 0.04
-    while GPIO.input(ULTRASONIC_ECHO) == 1:
-        pulse_end = time.time()
-        if pulse_end > timeout:
-            return None
-
-    pulse_duration = pulse_end - pulse_start
-    distance_cm = pulse_duration * 17150
+    pulse_start = _wait_edge(ULTRASONIC_ECHO, 0, time.perf_counter_ns() + 40_000_000)
+    if pulse_start < 0:
+        return None
+    pulse_end = _wait_edge(ULTRASONIC_ECHO, 1, pulse_start + 40_000_000)
+    if pulse_end < 0:
+        return None
+
+    distance_cm = (pulse_end - pulse_start) * 17150 / 1_000_000_000
     return round(distance_cm, 2)
 
 # --------------------------
-# Main loop
+# Sensor thread
 # --------------------------
-try:
-    print("Starting sensor monitoring... Press Ctrl+C to stop.\n")
-    while True:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+# Polling runs on its own daemon thread so the timing-sensitive loop is
+# never stalled by console or file I/O. The bounded queue hands finished
+# samples to the main thread; the same producer could feed a Tk
+# `after`-driven consumer unchanged if this script grows a GUI.
+sample_q = queue.Queue(maxsize=16)
+
+def sensor_loop():
+    # The DHT11 only produces a fresh reading every ~2 s; polling it faster
+    # just burns CPU on the bit-banged read and returns None more often.
+    DHT_PERIOD = 2.0
+    last_dht_read = -DHT_PERIOD
+    humidity, temperature = None, None
 
-        # Read DHT11
-        humidity, temperature = Adafruit_DHT.read(DHT_SENSOR, DHT_PIN)
+    while True:
+        # Same text as strftime("%Y-%m-%d %H:%M:%S") for a naive datetime,
+        # without re-interpreting a format string every sample
+        timestamp = datetime.now().isoformat(sep=' ', timespec='seconds')
+
+        # Read DHT11 at its own period, with two quick retries to smooth
+        # over the occasional failed bit-banged read; the other sensors
+        # keep the 100 ms cadence and reuse the last good temperature
+        now = time.monotonic()
+        if now - last_dht_read >= DHT_PERIOD:
+            humidity, temperature = Adafruit_DHT.read_retry(DHT_SENSOR, DHT_PIN,
+                                                            retries=2, delay_seconds=0)
+            last_dht_read = now
         temp_val = temperature if temperature is not None else "N/A"
 
         # Read MQ gas sensor (DO pin goes LOW when gas is detected)
@@ -80,29 +105,58 @@ try:
         level = read_ultrasonic()
         level_val = level if level is not None else "N/A"
 
-        # Anomaly detection
-        anomaly = "No"
-        if temp_val == "N/A" or level_val == "N/A":
-            anomaly = "Yes"
-        else:
-            if not (0 <= temp_val <= 50):
-                anomaly = "Yes"
-            if not (0 <= level_val <= 400):
-                anomaly = "Yes"
+        # Anomaly detection: boolean range checks on the raw readings, with
+        # None as the missing-value sentinel -- no str/float mixed compares
+        t_ok = temperature is not None and 0 <= temperature <= 50
+        l_ok = level is not None and 0 <= level <= 400
+        anomaly = "No" if t_ok and l_ok else "Yes"
+
+        try:
+            sample_q.put_nowait((timestamp, temp_val, ppm_val, level_val,
+                                 anomaly, gas_detected))
+        except queue.Full:
+            pass  # consumer stalled; drop rather than back up the sensors
+
+        time.sleep(0.1)
+
+# --------------------------
+# Main loop
+# --------------------------
+# Open the log once for the program lifetime. Lines are batched in memory
+# and each batch lands as a single join+write per FLUSH_EVERY samples --
+# one Python-to-C transition per batch rather than one per line -- with a
+# 64 KiB buffer so writes reach the SD card page-granular.
+logfile = open(filename, mode='a', newline='', buffering=1 << 16)
+write_buf = []
+FLUSH_EVERY = 50
+
+# The daemon thread may be mid-read when the process exits, so pin release
+# is registered with atexit to cover every exit path.
+atexit.register(GPIO.cleanup)
+
+try:
+    print("Starting sensor monitoring... Press Ctrl+C to stop.\n")
+    threading.Thread(target=sensor_loop, daemon=True).start()
+
+    while True:
+        timestamp, temp_val, ppm_val, level_val, anomaly, gas_detected = sample_q.get()
 
         # Display to console
         gas_status = "Gas Detected" if gas_detected else "No Gas"
         print(f"[{timestamp}] TEMP: {temp_val}°C | GAS: {gas_status} | LEVEL: {level_val} cm | Sensor_Fault: {anomaly}")
 
-        # Write to CSV
-        with open(filename, mode='a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([timestamp, temp_val, ppm_val, level_val, anomaly])
-
-        time.sleep(0.1)
+        # Buffer the preformatted CSV line; every field is a number, an ISO
+        # timestamp, or one of Yes/No/N/A, so no quoting machinery is needed
+        write_buf.append(f"{timestamp},{temp_val},{ppm_val},{level_val},{anomaly}\n")
+        if len(write_buf) >= FLUSH_EVERY:
+            logfile.write("".join(write_buf))
+            logfile.flush()
+            write_buf.clear()
 
 except KeyboardInterrupt:
     print("\nMonitoring stopped by user.")
 
 finally:
-    GPIO.cleanup()
+    if write_buf:
+        logfile.write("".join(write_buf))
+    logfile.close()